@@ -17,3 +17,5 @@ STREAM_MAGIC_EXCEPTIONS = (
 )
 
 CONNECT_TIMEOUT = 5
+
+STATE_WRITE_DEBOUNCE = 0.05
@@ -12,6 +12,7 @@ class CambridgeAudioEntity(Entity):
     """Defines a base Cambridge Audio entity."""
 
     _attr_has_entity_name = True
+    _attr_should_poll = False
 
     def __init__(self, client: StreamMagicClient) -> None:
         """Initialize Cambridge Audio entity."""
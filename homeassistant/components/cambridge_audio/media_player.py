@@ -2,11 +2,13 @@
 
 from __future__ import annotations
 
-from datetime import datetime
+from collections.abc import Sequence
+from typing import Any
 
 from aiostreammagic import (
     RepeatMode as CambridgeRepeatMode,
     ShuffleMode,
+    Source,
     StreamMagicClient,
     TransportControl,
 )
@@ -20,9 +22,11 @@ from homeassistant.components.media_player import (
     RepeatMode,
 )
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.debounce import Debouncer
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
+from .const import LOGGER, STATE_WRITE_DEBOUNCE
 from .entity import CambridgeAudioEntity
 
 BASE_FEATURES = (
@@ -40,6 +44,9 @@ PREAMP_FEATURES = (
 TRANSPORT_FEATURES: dict[TransportControl, MediaPlayerEntityFeature] = {
     TransportControl.PLAY: MediaPlayerEntityFeature.PLAY,
     TransportControl.PAUSE: MediaPlayerEntityFeature.PAUSE,
+    TransportControl.PLAY_PAUSE: (
+        MediaPlayerEntityFeature.PLAY | MediaPlayerEntityFeature.PAUSE
+    ),
     TransportControl.TRACK_NEXT: MediaPlayerEntityFeature.NEXT_TRACK,
     TransportControl.TRACK_PREVIOUS: MediaPlayerEntityFeature.PREVIOUS_TRACK,
     TransportControl.TOGGLE_REPEAT: MediaPlayerEntityFeature.REPEAT_SET,
@@ -47,6 +54,24 @@ TRANSPORT_FEATURES: dict[TransportControl, MediaPlayerEntityFeature] = {
     TransportControl.SEEK: MediaPlayerEntityFeature.SEEK,
 }
 
+PLAY_STATE_MAP: dict[str, MediaPlayerState] = {
+    "play": MediaPlayerState.PLAYING,
+    "pause": MediaPlayerState.PAUSED,
+    "connecting": MediaPlayerState.BUFFERING,
+    "stop": MediaPlayerState.IDLE,
+    "ready": MediaPlayerState.IDLE,
+}
+
+REPEAT_MAP_TO_HA: dict[CambridgeRepeatMode, RepeatMode] = {
+    CambridgeRepeatMode.ALL: RepeatMode.ALL,
+}
+
+REPEAT_MAP_TO_CAMBRIDGE: dict[RepeatMode, CambridgeRepeatMode] = {
+    RepeatMode.OFF: CambridgeRepeatMode.OFF,
+    RepeatMode.ALL: CambridgeRepeatMode.ALL,
+    RepeatMode.ONE: CambridgeRepeatMode.ALL,
+}
+
 
 async def async_setup_entry(
     hass: HomeAssistant,
@@ -64,135 +89,133 @@ class CambridgeAudioDevice(CambridgeAudioEntity, MediaPlayerEntity):
     _attr_name = None
     _attr_media_content_type = MediaType.MUSIC
     _attr_device_class = MediaPlayerDeviceClass.RECEIVER
+    _write_debouncer: Debouncer[None]
 
     def __init__(self, client: StreamMagicClient) -> None:
         """Initialize an Cambridge Audio entity."""
         super().__init__(client)
         self._attr_unique_id = client.info.unit_id
+        self._controls: frozenset[TransportControl] = frozenset()
+        self._features_key: tuple[Any, ...] | None = None
+        self._sources: Sequence[Source] | None = None
+        self._id_to_name: dict[str, str] = {}
+        self._name_to_id: dict[str, str] = {}
+        self._last_fingerprint: tuple[Any, ...] = ()
 
     async def _state_update_callback(self, _client: StreamMagicClient) -> None:
         """Call when the device is notified of changes."""
-        self.schedule_update_ha_state()
-
-    async def async_added_to_hass(self) -> None:
-        """Register callback handlers."""
-        await self.client.register_state_update_callbacks(self._state_update_callback)
-
-    async def async_will_remove_from_hass(self) -> None:
-        """Remove callbacks."""
-        await self.client.unregister_state_update_callbacks(self._state_update_callback)
+        self._async_handle_state_update()
+
+    @callback
+    def _async_handle_state_update(self) -> None:
+        """Refresh cached attributes and schedule a state write."""
+        self._refresh_cached_attrs()
+        self._write_debouncer.async_schedule_call()
+
+    @callback
+    def _async_flush_state(self) -> None:
+        """Write the state collected from a burst of updates if it changed."""
+        fingerprint = self._state_fingerprint()
+        if fingerprint == self._last_fingerprint:
+            return
+        self._last_fingerprint = fingerprint
+        self.async_write_ha_state()
+
+    def _refresh_cached_attrs(self) -> None:
+        """Copy the pushed device values into the entity attributes."""
+        client = self.client
+        state = client.state
+        play_state = client.play_state
+        metadata = play_state.metadata
+        self._controls = frozenset(client.now_playing.controls or ())
+        self._refresh_supported_features(state.pre_amp_mode)
+        self._refresh_source_maps()
+        media_state = play_state.state
+        if media_state == "NETWORK":
+            self._attr_state = MediaPlayerState.STANDBY
+        elif not state.power:
+            self._attr_state = MediaPlayerState.OFF
+        else:
+            self._attr_state = PLAY_STATE_MAP.get(media_state, MediaPlayerState.ON)
+        self._attr_source = self._id_to_name.get(state.source)
+        self._attr_media_title = metadata.title
+        self._attr_media_artist = metadata.artist
+        self._attr_media_album_name = metadata.album
+        self._attr_media_image_url = metadata.art_url
+        self._attr_media_duration = metadata.duration
+        self._attr_media_position = play_state.position
+        self._attr_media_position_updated_at = (
+            client.position_last_updated if play_state.position is not None else None
+        )
+        self._attr_is_volume_muted = state.mute
+        self._attr_volume_level = (state.volume_percent or 0) / 100
+        mode_shuffle = play_state.mode_shuffle
+        self._attr_shuffle = bool(mode_shuffle) and mode_shuffle != ShuffleMode.OFF
+        self._attr_repeat = REPEAT_MAP_TO_HA.get(play_state.mode_repeat, RepeatMode.OFF)
+
+    def _state_fingerprint(self) -> tuple[Any, ...]:
+        """Return the cached attributes set by the last refresh."""
+        return (
+            self._attr_state,
+            self._attr_supported_features,
+            self._attr_source,
+            tuple(self._attr_source_list or ()),
+            self._attr_media_title,
+            self._attr_media_artist,
+            self._attr_media_album_name,
+            self._attr_media_image_url,
+            self._attr_media_duration,
+            self._attr_media_position,
+            self._attr_media_position_updated_at,
+            self._attr_is_volume_muted,
+            self._attr_volume_level,
+            self._attr_shuffle,
+            self._attr_repeat,
+        )
 
-    @property
-    def supported_features(self) -> MediaPlayerEntityFeature:
-        """Supported features for the media player."""
-        controls = self.client.now_playing.controls
+    def _refresh_supported_features(self, pre_amp_mode: bool) -> None:
+        """Rebuild the feature mask when the controls or pre-amp mode change."""
+        key = (self._controls, pre_amp_mode)
+        if key == self._features_key:
+            return
         features = BASE_FEATURES
-        if self.client.state.pre_amp_mode:
+        if pre_amp_mode:
             features |= PREAMP_FEATURES
-        if TransportControl.PLAY_PAUSE in controls:
-            features |= MediaPlayerEntityFeature.PLAY | MediaPlayerEntityFeature.PAUSE
-        for control in controls:
-            feature = TRANSPORT_FEATURES.get(control)
-            if feature:
+        for control in self._controls:
+            if feature := TRANSPORT_FEATURES.get(control):
                 features |= feature
-        return features
+        self._features_key = key
+        self._attr_supported_features = features
+
+    def _refresh_source_maps(self) -> None:
+        """Rebuild the source lookups when the client reports new sources."""
+        sources = self.client.sources or ()
+        if sources is self._sources:
+            return
+        self._sources = sources
+        self._id_to_name = {src.id: src.name for src in sources}
+        # Build in reverse so the first source with a given name wins
+        self._name_to_id = {src.name: src.id for src in reversed(sources)}
+        self._attr_source_list = [src.name for src in sources]
 
-    @property
-    def state(self) -> MediaPlayerState:
-        """Return the state of the device."""
-        media_state = self.client.play_state.state
-        if media_state == "NETWORK":
-            return MediaPlayerState.STANDBY
-        if self.client.state.power:
-            if media_state == "play":
-                return MediaPlayerState.PLAYING
-            if media_state == "pause":
-                return MediaPlayerState.PAUSED
-            if media_state == "connecting":
-                return MediaPlayerState.BUFFERING
-            if media_state in ("stop", "ready"):
-                return MediaPlayerState.IDLE
-            return MediaPlayerState.ON
-        return MediaPlayerState.OFF
-
-    @property
-    def source_list(self) -> list[str]:
-        """Return a list of available input sources."""
-        return [item.name for item in self.client.sources]
-
-    @property
-    def source(self) -> str | None:
-        """Return the current input source."""
-        return next(
-            (
-                item.name
-                for item in self.client.sources
-                if item.id == self.client.state.source
-            ),
-            None,
+    async def async_added_to_hass(self) -> None:
+        """Register callback handlers."""
+        self._write_debouncer = Debouncer(
+            self.hass,
+            LOGGER,
+            cooldown=STATE_WRITE_DEBOUNCE,
+            immediate=True,
+            function=self._async_flush_state,
         )
+        self._refresh_cached_attrs()
+        # The platform writes this state once the entity has been added
+        self._last_fingerprint = self._state_fingerprint()
+        await self.client.register_state_update_callbacks(self._state_update_callback)
 
-    @property
-    def media_title(self) -> str | None:
-        """Title of current playing media."""
-        return self.client.play_state.metadata.title
-
-    @property
-    def media_artist(self) -> str | None:
-        """Artist of current playing media, music track only."""
-        return self.client.play_state.metadata.artist
-
-    @property
-    def media_album_name(self) -> str | None:
-        """Album name of current playing media, music track only."""
-        return self.client.play_state.metadata.album
-
-    @property
-    def media_image_url(self) -> str | None:
-        """Image url of current playing media."""
-        return self.client.play_state.metadata.art_url
-
-    @property
-    def media_duration(self) -> int | None:
-        """Duration of the current media."""
-        return self.client.play_state.metadata.duration
-
-    @property
-    def media_position(self) -> int | None:
-        """Position of the current media."""
-        return self.client.play_state.position
-
-    @property
-    def media_position_updated_at(self) -> datetime:
-        """Last time the media position was updated."""
-        return self.client.position_last_updated
-
-    @property
-    def is_volume_muted(self) -> bool | None:
-        """Volume mute status."""
-        return self.client.state.mute
-
-    @property
-    def volume_level(self) -> float | None:
-        """Current pre-amp volume level."""
-        volume = self.client.state.volume_percent or 0
-        return volume / 100
-
-    @property
-    def shuffle(self) -> bool | None:
-        """Current shuffle configuration."""
-        mode_shuffle = self.client.play_state.mode_shuffle
-        if not mode_shuffle:
-            return False
-        return mode_shuffle != ShuffleMode.OFF
-
-    @property
-    def repeat(self) -> RepeatMode | None:
-        """Current repeat configuration."""
-        mode_repeat = RepeatMode.OFF
-        if self.client.play_state.mode_repeat == CambridgeRepeatMode.ALL:
-            mode_repeat = RepeatMode.ALL
-        return mode_repeat
+    async def async_will_remove_from_hass(self) -> None:
+        """Remove callbacks."""
+        self._write_debouncer.async_shutdown()
+        self.client.unregister_state_update_callbacks(self._state_update_callback)
 
     async def async_media_play_pause(self) -> None:
         """Toggle play/pause the current media."""
@@ -200,7 +223,7 @@ class CambridgeAudioDevice(CambridgeAudioEntity, MediaPlayerEntity):
 
     async def async_media_pause(self) -> None:
         """Pause the current media."""
-        controls = self.client.now_playing.controls
+        controls = self._controls
         if (
             TransportControl.PAUSE not in controls
             and TransportControl.PLAY_PAUSE in controls
@@ -215,7 +238,7 @@ class CambridgeAudioDevice(CambridgeAudioEntity, MediaPlayerEntity):
 
     async def async_media_play(self) -> None:
         """Play the current media."""
-        controls = self.client.now_playing.controls
+        controls = self._controls
         if (
             TransportControl.PLAY not in controls
             and TransportControl.PLAY_PAUSE in controls
@@ -234,10 +257,9 @@ class CambridgeAudioDevice(CambridgeAudioEntity, MediaPlayerEntity):
 
     async def async_select_source(self, source: str) -> None:
         """Select the source."""
-        for src in self.client.sources:
-            if src.name == source:
-                await self.client.set_source_by_id(src.id)
-                break
+        src_id = self._name_to_id.get(source)
+        if src_id is not None:
+            await self.client.set_source_by_id(src_id)
 
     async def async_turn_on(self) -> None:
         """Power on the device."""
@@ -269,14 +291,8 @@ class CambridgeAudioDevice(CambridgeAudioEntity, MediaPlayerEntity):
 
     async def async_set_shuffle(self, shuffle: bool) -> None:
         """Set the shuffle mode for the current queue."""
-        shuffle_mode = ShuffleMode.OFF
-        if shuffle:
-            shuffle_mode = ShuffleMode.ALL
-        await self.client.set_shuffle(shuffle_mode)
+        await self.client.set_shuffle(ShuffleMode.ALL if shuffle else ShuffleMode.OFF)
 
     async def async_set_repeat(self, repeat: RepeatMode) -> None:
         """Set the repeat mode for the current queue."""
-        repeat_mode = CambridgeRepeatMode.OFF
-        if repeat:
-            repeat_mode = CambridgeRepeatMode.ALL
-        await self.client.set_repeat(repeat_mode)
+        await self.client.set_repeat(REPEAT_MAP_TO_CAMBRIDGE[repeat])
@@ -1,5 +1,7 @@
 """Tests for the Cambridge Audio integration."""
 
+from unittest.mock import AsyncMock
+
 from homeassistant.core import HomeAssistant
 
 from tests.common import MockConfigEntry
@@ -11,3 +13,8 @@ async def setup_integration(hass: HomeAssistant, config_entry: MockConfigEntry)
 
     await hass.config_entries.async_setup(config_entry.entry_id)
     await hass.async_block_till_done()
+
+
+async def mock_state_update(client: AsyncMock) -> None:
+    """Trigger the state update callback registered by the media player."""
+    await client.register_state_update_callbacks.call_args[0][0](client)
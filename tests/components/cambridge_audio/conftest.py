@@ -1,15 +1,16 @@
 """Cambridge Audio tests configuration."""
 
 from collections.abc import Generator
+from datetime import UTC, datetime
 from unittest.mock import Mock, patch
 
-from aiostreammagic.models import Info
+from aiostreammagic.models import Info, NowPlaying, PlayState, Source, State
 import pytest
 
 from homeassistant.components.cambridge_audio.const import DOMAIN
 from homeassistant.const import CONF_HOST
 
-from tests.common import MockConfigEntry, load_fixture
+from tests.common import MockConfigEntry, load_fixture, load_json_array_fixture
 from tests.components.smhi.common import AsyncMock
 
 
@@ -39,6 +40,18 @@ def mock_stream_magic_client() -> Generator[AsyncMock]:
         client = mock_client.return_value
         client.host = "192.168.20.218"
         client.info = Info.from_json(load_fixture("get_info.json", DOMAIN))
+        client.sources = [
+            Source.from_dict(x)
+            for x in load_json_array_fixture("get_sources.json", DOMAIN)
+        ]
+        client.state = State.from_json(load_fixture("get_state.json", DOMAIN))
+        client.play_state = PlayState.from_json(
+            load_fixture("get_play_state.json", DOMAIN)
+        )
+        client.now_playing = NowPlaying.from_json(
+            load_fixture("get_now_playing.json", DOMAIN)
+        )
+        client.position_last_updated = datetime(2024, 9, 1, 12, 0, tzinfo=UTC)
         client.is_connected = Mock(return_value=True)
 
         yield client
@@ -0,0 +1,140 @@
+"""Tests for the Cambridge Audio media player."""
+
+from datetime import timedelta
+from unittest.mock import AsyncMock
+
+from aiostreammagic import RepeatMode as CambridgeRepeatMode
+from freezegun.api import FrozenDateTimeFactory
+
+from homeassistant.components.cambridge_audio.const import STATE_WRITE_DEBOUNCE
+from homeassistant.components.media_player import (
+    ATTR_MEDIA_POSITION,
+    ATTR_MEDIA_POSITION_UPDATED_AT,
+    ATTR_MEDIA_REPEAT,
+    ATTR_MEDIA_VOLUME_LEVEL,
+    DOMAIN as MP_DOMAIN,
+    SCAN_INTERVAL,
+    RepeatMode,
+)
+from homeassistant.config_entries import ConfigEntryState
+from homeassistant.const import ATTR_ENTITY_ID, SERVICE_REPEAT_SET, STATE_UNAVAILABLE
+from homeassistant.core import Event, EventStateChangedData, HomeAssistant, callback
+from homeassistant.helpers.event import async_track_state_change_event
+
+from . import mock_state_update, setup_integration
+
+from tests.common import MockConfigEntry, async_fire_time_changed
+
+ENTITY_ID = "media_player.cambridge_audio_cxnv2"
+
+
+async def test_repeat_set_off(
+    hass: HomeAssistant,
+    mock_stream_magic_client: AsyncMock,
+    mock_config_entry: MockConfigEntry,
+) -> None:
+    """Test turning repeat off sends the off mode to the device."""
+    await setup_integration(hass, mock_config_entry)
+
+    await hass.services.async_call(
+        MP_DOMAIN,
+        SERVICE_REPEAT_SET,
+        {ATTR_ENTITY_ID: ENTITY_ID, ATTR_MEDIA_REPEAT: RepeatMode.OFF},
+        blocking=True,
+    )
+
+    mock_stream_magic_client.set_repeat.assert_called_once_with(CambridgeRepeatMode.OFF)
+
+
+async def test_unload_unregisters_callback(
+    hass: HomeAssistant,
+    mock_stream_magic_client: AsyncMock,
+    mock_config_entry: MockConfigEntry,
+) -> None:
+    """Test unloading the entry unregisters the state update callback."""
+    await setup_integration(hass, mock_config_entry)
+
+    assert await hass.config_entries.async_unload(mock_config_entry.entry_id)
+    await hass.async_block_till_done()
+
+    assert mock_config_entry.state is ConfigEntryState.NOT_LOADED
+    mock_stream_magic_client.unregister_state_update_callbacks.assert_called_once()
+    assert hass.states.get(ENTITY_ID).state == STATE_UNAVAILABLE
+
+
+async def test_identical_push_skips_state_write(
+    hass: HomeAssistant,
+    freezer: FrozenDateTimeFactory,
+    mock_stream_magic_client: AsyncMock,
+    mock_config_entry: MockConfigEntry,
+) -> None:
+    """Test neither an unchanged push nor a poll interval writes state."""
+    await setup_integration(hass, mock_config_entry)
+    last_reported = hass.states.get(ENTITY_ID).last_reported
+
+    freezer.tick(SCAN_INTERVAL + timedelta(seconds=1))
+    async_fire_time_changed(hass)
+    await mock_state_update(mock_stream_magic_client)
+    await hass.async_block_till_done()
+
+    assert hass.states.get(ENTITY_ID).last_reported == last_reported
+
+
+async def test_burst_of_pushes_writes_once(
+    hass: HomeAssistant,
+    freezer: FrozenDateTimeFactory,
+    mock_stream_magic_client: AsyncMock,
+    mock_config_entry: MockConfigEntry,
+) -> None:
+    """Test pushes during the cooldown collapse into one trailing write."""
+    await setup_integration(hass, mock_config_entry)
+    volumes: list[float] = []
+
+    @callback
+    def _state_changed(event: Event[EventStateChangedData]) -> None:
+        volumes.append(event.data["new_state"].attributes.get(ATTR_MEDIA_VOLUME_LEVEL))
+
+    async_track_state_change_event(hass, ENTITY_ID, _state_changed)
+
+    for volume in (20, 30, 40):
+        mock_stream_magic_client.state.volume_percent = volume
+        await mock_state_update(mock_stream_magic_client)
+    await hass.async_block_till_done()
+
+    # The first push is written right away, the rest wait for the cooldown
+    assert volumes == [0.2]
+
+    freezer.tick(STATE_WRITE_DEBOUNCE)
+    async_fire_time_changed(hass)
+    await hass.async_block_till_done()
+
+    assert volumes == [0.2, 0.4]
+    last_reported = hass.states.get(ENTITY_ID).last_reported
+
+    # Nothing writes state outside the debounced push path
+    freezer.tick(SCAN_INTERVAL + timedelta(seconds=1))
+    async_fire_time_changed(hass)
+    await hass.async_block_till_done()
+
+    assert volumes == [0.2, 0.4]
+    assert hass.states.get(ENTITY_ID).last_reported == last_reported
+
+
+async def test_position_updated_at_without_position(
+    hass: HomeAssistant,
+    mock_stream_magic_client: AsyncMock,
+    mock_config_entry: MockConfigEntry,
+) -> None:
+    """Test the position timestamp is only reported along with a position."""
+    await setup_integration(hass, mock_config_entry)
+    attributes = hass.states.get(ENTITY_ID).attributes
+    assert attributes[ATTR_MEDIA_POSITION] == 47
+    assert ATTR_MEDIA_POSITION_UPDATED_AT in attributes
+
+    mock_stream_magic_client.play_state.position = None
+    await mock_state_update(mock_stream_magic_client)
+    await hass.async_block_till_done()
+
+    attributes = hass.states.get(ENTITY_ID).attributes
+    assert ATTR_MEDIA_POSITION not in attributes
+    assert ATTR_MEDIA_POSITION_UPDATED_AT not in attributes